@@ -0,0 +1,659 @@
+"""WebFrame - scaffold a full-stack web project (React + Express + Postgres).
+
+Running this script creates the project tree, installs the client and server
+dependencies, and drops placeholder source files so a new project is ready to
+hack on immediately.  Cloud/infra wiring (AWS, Firebase, docker-compose,
+monitoring, CI and SSL) is handled by :class:`ProjectSetup`, driven by a
+``config.yaml`` credentials file.
+"""
+
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import os
+import sys
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from operator import getitem
+
+# boto3, firebase_admin and yaml are imported lazily inside the methods
+# that use them; together they add several hundred ms of import time the
+# plain scaffold run never needs.
+
+# Status lines are buffered in memory and emitted in one batch at exit
+# (or immediately on error) instead of flushing stdout line by line.
+_log_handler = logging.handlers.MemoryHandler(
+    200, flushLevel=logging.ERROR, target=logging.StreamHandler(sys.stdout)
+)
+logger = logging.getLogger(__name__)
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+atexit.register(_log_handler.flush)
+
+project_dir = os.path.join(os.getcwd(), "webframe-app")
+client_dir = os.path.join(project_dir, "client")
+server_dir = os.path.join(project_dir, "server")
+
+if os.sep == "/":
+    # Joining precomputed prefixes with an f-string-style "/".join beats
+    # os.path.join's varargs loop on the hot placeholder paths below.
+    def _p(*parts):
+        return "/".join(parts)
+else:
+    _p = os.path.join
+
+client_src = _p(client_dir, "src")
+server_src = _p(server_dir, "src")
+client_pages = _p(client_src, "pages")
+client_components = _p(client_src, "components")
+client_services = _p(client_src, "services")
+client_hooks = _p(client_src, "hooks")
+client_utils = _p(client_src, "utils")
+client_styles = _p(client_src, "styles")
+client_context = _p(client_src, "context")
+client_config = _p(client_src, "config")
+server_routes = _p(server_src, "routes")
+server_controllers = _p(server_src, "controllers")
+server_models = _p(server_src, "models")
+server_middleware = _p(server_src, "middleware")
+server_config = _p(server_src, "config")
+server_utils = _p(server_src, "utils")
+
+# Queued (path, content) writes, drained in one pass by flush_files().
+_PENDING = []
+
+# Static file templates, pre-encoded once at import so the write path can
+# dump them straight to disk without a per-write str.encode pass.
+_TEMPLATES: dict[str, bytes] = {
+    "prometheus.yml": b"""global:
+  scrape_interval: 15s
+
+scrape_configs:
+  - job_name: 'webframe-server'
+    static_configs:
+      - targets: ['server:5000']
+  - job_name: 'node'
+    static_configs:
+      - targets: ['node-exporter:9100']
+""",
+    "grafana-datasources.yml": b"""apiVersion: 1
+
+datasources:
+  - name: Prometheus
+    type: prometheus
+    access: proxy
+    url: http://prometheus:9090
+    isDefault: true
+""",
+    "main.yml": b"""name: CI
+
+on:
+  push:
+    branches: [main]
+  pull_request:
+    branches: [main]
+
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - uses: actions/setup-node@v4
+        with:
+          node-version: 20
+      - name: Install server dependencies
+        run: npm ci
+        working-directory: server
+      - name: Install client dependencies
+        run: npm ci
+        working-directory: client
+      - name: Run tests
+        run: npm test -- --watchAll=false
+        working-directory: client
+""",
+}
+
+
+def run_command(command, success_message, error_message):
+    """Run a command given as an argv list, logging a status line either way.
+
+    Argv lists exec the program directly instead of forking a shell to
+    re-parse a command string.
+    """
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        logger.info(success_message)
+    except subprocess.CalledProcessError:
+        logger.info(error_message)
+        sys.exit(1)
+
+
+def create_file(file_path, content):
+    """Queue a file for writing; the queue is drained by flush_files().
+
+    ``content`` may be str or pre-encoded bytes (see ``_TEMPLATES``).
+    """
+    _PENDING.append((file_path, content))
+
+
+# blake2b digest of the last content written per path, so repeated queue
+# flushes within one run skip the on-disk comparison entirely.
+_DIGESTS = {}
+
+
+def _safe_read(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _fast_write(path, data):
+    """Write a small payload with raw fd calls, skipping the io stack.
+
+    For sub-kilobyte placeholders the TextIOWrapper/BufferedWriter layers
+    cost more Python-level calls than the write itself; a bare
+    open/write/close on the fd moves the same bytes in three syscalls.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_job(job):
+    """Write one queued file atomically, skipping unchanged content.
+
+    The payload lands in a sibling .tmp that is os.replace()d over the
+    target, so an interrupted run never leaves a half-written file; a
+    rerun whose content matches what is already on disk does no write at
+    all.
+    """
+    path, content = job
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if _DIGESTS.get(path) == digest:
+        return
+    if _safe_read(path) == data:
+        _DIGESTS[path] = digest
+        return
+    tmp = path + ".tmp"
+    if len(data) < 1024:
+        _fast_write(tmp, data)
+    else:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(data)
+    os.replace(tmp, path)
+    _DIGESTS[path] = digest
+
+
+def _drain(jobs):
+    """Write queued (path, content) jobs through a thread pool.
+
+    Directories are created in a single-threaded pass first (they must
+    exist before any worker opens a file), then the independent writes are
+    fanned out across threads: the GIL is released during each write()
+    syscall, so disk queue depth rises with the worker count.
+    """
+    jobs.sort(key=lambda job: os.path.dirname(job[0]))
+    for parent in {os.path.dirname(path) or "." for path, _ in jobs}:
+        os.makedirs(parent, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(_write_job, jobs, chunksize=4))
+    jobs.clear()
+
+
+def make_dirs(dirs, root=None):
+    """Create a batch of target directories with minimal stat traffic.
+
+    Shortest paths go first so each makedirs call finds its ancestors
+    already present. When ``root`` is given, one os.walk of it builds an
+    in-memory set of everything already on disk, so a re-run of the
+    script skips its ~20 targets without re-stat()ing each path
+    component.
+    """
+    existing = set()
+    if root is not None and os.path.isdir(root):
+        existing.add(root)
+        for r, subdirs, _ in os.walk(root):
+            # Prune dependency/VCS trees in place; they hold tens of
+            # thousands of directories none of our targets live under.
+            subdirs[:] = [
+                d for d in subdirs
+                if d not in ("node_modules", "venv", ".git")
+            ]
+            for d in subdirs:
+                existing.add(os.path.join(r, d))
+    need = [
+        d
+        for d in sorted(dirs, key=len)
+        if d not in existing and not os.path.isdir(d)
+    ]
+    for d in need:
+        os.makedirs(d, exist_ok=True)
+
+
+def flush_files():
+    """Write every queued file in one parallel, buffered pass.
+
+    Writes are sorted by parent directory so consecutive opens stay within
+    the same directory, and each file is written in a single large-buffer
+    shot instead of one open/write/close round-trip per placeholder.
+    """
+    _drain(_PENDING)
+
+
+class ProjectSetup:
+    """Configure cloud services and infrastructure for a scaffolded project."""
+
+    _REQUIRED = (
+        ("cloud", "aws", "access_key"),
+        ("cloud", "aws", "secret_key"),
+        ("cloud", "firebase", "credentials_file"),
+        ("domains", "primary_domain"),
+        ("ssl", "email"),
+    )
+
+    def __init__(self, config_path="config.yaml"):
+        self.config = self.load_config(config_path)
+        self._pending = []
+        self._compose_fragments = []
+        self._dirs = {
+            client_config,
+            server_config,
+            _p(project_dir, "monitoring"),
+            _p(project_dir, ".github", "workflows"),
+        }
+
+    def load_config(self, config_path):
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:  # libyaml not available; slower pure-Python parse
+            from yaml import SafeLoader as Loader
+        with open(config_path) as f:
+            return yaml.load(f, Loader=Loader)
+
+    def validate_config(self):
+        for keys in self._REQUIRED:
+            if self.get_nested_dict_value(self.config, keys) is None:
+                raise ValueError(
+                    "Missing required config value: " + ".".join(keys)
+                )
+
+    def get_nested_dict_value(self, dict_obj, keys):
+        # reduce(getitem, ...) keeps the key chain in C instead of a
+        # per-key interpreter loop with membership tests.
+        try:
+            return reduce(getitem, keys, dict_obj)
+        except (KeyError, TypeError):
+            return None
+
+    def create_file(self, file_path, content):
+        """Queue a file for writing; drained by _flush() in setup_project()."""
+        self._pending.append((file_path, content))
+
+    def _flush(self):
+        _drain(self._pending)
+
+    def _flush_compose(self):
+        """Append every collected compose fragment in one buffered write."""
+        if not self._compose_fragments:
+            return
+        compose_path = _p(project_dir, "docker-compose.yml")
+        with open(compose_path, "a", buffering=1 << 16) as f:
+            f.write("".join(self._compose_fragments))
+        self._compose_fragments.clear()
+
+    def setup_aws(self):
+        import boto3
+
+        aws_config = self.config["cloud"]["aws"]
+        session = boto3.Session(
+            aws_access_key_id=aws_config["access_key"],
+            aws_secret_access_key=aws_config["secret_key"],
+            region_name=aws_config.get("region", "us-east-1"),
+        )
+        s3 = session.client("s3")
+        bucket = aws_config.get("bucket", "webframe-assets")
+        s3.create_bucket(Bucket=bucket)
+        logger.info(f"AWS bucket '{bucket}' ready")
+
+    def setup_firebase(self):
+        import firebase_admin
+        from firebase_admin import credentials
+
+        firebase_config = self.config["cloud"]["firebase"]
+        cred = credentials.Certificate(firebase_config["credentials_file"])
+        firebase_admin.initialize_app(cred)
+        web_config = {
+            "apiKey": firebase_config.get("api_key", ""),
+            "authDomain": firebase_config.get("auth_domain", ""),
+            "projectId": firebase_config.get("project_id", ""),
+            "storageBucket": firebase_config.get("storage_bucket", ""),
+            "messagingSenderId": firebase_config.get("messaging_sender_id", ""),
+            "appId": firebase_config.get("app_id", ""),
+        }
+        config_path = _p(client_config, "firebase.ts")
+        # json.dump streams straight into the file handle, avoiding the
+        # dumps() string plus concatenation copies of the payload.
+        with open(config_path, "w", buffering=1 << 15) as f:
+            f.write("export const firebaseConfig = ")
+            json.dump(web_config, f, indent=2, separators=(",", ": "))
+            f.write(";\n")
+        logger.info("Firebase configured")
+
+    def setup_database(self):
+        db_config = self.config.get("database", {})
+        fragment = f"""
+  postgres:
+    image: postgres:15
+    environment:
+      POSTGRES_USER: {db_config.get('user', 'webframe')}
+      POSTGRES_PASSWORD: {db_config.get('password', 'webframe')}
+      POSTGRES_DB: {db_config.get('name', 'webframe')}
+    ports:
+      - "5432:5432"
+    volumes:
+      - pgdata:/var/lib/postgresql/data
+"""
+        self._compose_fragments.append(fragment)
+        logger.info("Database service added to docker-compose.yml")
+
+    def setup_monitoring(self):
+        monitoring_dir = _p(project_dir, "monitoring")
+        self.create_file(
+            _p(monitoring_dir, "prometheus.yml"),
+            _TEMPLATES["prometheus.yml"],
+        )
+        self.create_file(
+            _p(monitoring_dir, "grafana-datasources.yml"),
+            _TEMPLATES["grafana-datasources.yml"],
+        )
+        fragment = """
+  prometheus:
+    image: prom/prometheus:latest
+    volumes:
+      - ./monitoring/prometheus.yml:/etc/prometheus/prometheus.yml
+    ports:
+      - "9090:9090"
+
+  grafana:
+    image: grafana/grafana:latest
+    volumes:
+      - ./monitoring/grafana-datasources.yml:/etc/grafana/provisioning/datasources/datasources.yml
+    ports:
+      - "3001:3000"
+"""
+        self._compose_fragments.append(fragment)
+        logger.info("Monitoring stack configured")
+
+    def setup_ci_cd(self):
+        workflows_dir = _p(project_dir, ".github", "workflows")
+        self.create_file(
+            _p(workflows_dir, "main.yml"), _TEMPLATES["main.yml"]
+        )
+        logger.info("CI/CD workflow created")
+
+    def create_config_files(self):
+        db_config = self.config.get("database", {})
+        env_content = f"""PORT=5000
+DATABASE_URL=postgres://{db_config.get('user', 'webframe')}:{db_config.get('password', 'webframe')}@localhost:5432/{db_config.get('name', 'webframe')}
+NODE_ENV=development
+"""
+        self.create_file(_p(server_dir, ".env"), env_content)
+        self.create_file(
+            _p(project_dir, ".dockerignore"),
+            "node_modules\n.env\n*.log\n",
+        )
+        logger.info("Config files created")
+
+    def setup_ssl(self):
+        ssl_config = self.config["ssl"]
+        # One certbot invocation covers both domains; argv form needs no
+        # shell for quoting.
+        command = [
+            "certbot", "certonly", "--standalone",
+            "--preferred-challenges", "http",
+            "--email", ssl_config["email"], "--agree-tos", "--no-eff-email",
+            "-d", self.config["domains"]["primary_domain"],
+            "-d", self.config["domains"]["api_domain"],
+        ]
+        run_command(command, "SSL certificates issued", "certbot failed")
+
+    def setup_project(self):
+        self.validate_config()
+        make_dirs(self._dirs, root=project_dir)
+        self.setup_aws()
+        self.setup_firebase()
+        self.setup_database()
+        self.setup_monitoring()
+        self.setup_ci_cd()
+        self._flush_compose()
+        self.create_config_files()
+        if self.config.get("ssl", {}).get("enabled", False):
+            self.setup_ssl()
+        self._flush()
+        logger.info("Project setup complete")
+
+
+if __name__ == "__main__":
+    logger.info("Scaffolding WebFrame project...")
+
+    # Only the server and top-level directories are created up front:
+    # create-react-app refuses to scaffold into a client/ that already
+    # holds a src/ tree, so the client subtree is created after the
+    # bootstrap has run.
+    dirs = {
+        project_dir,
+        server_dir,
+        server_routes,
+        server_controllers,
+        server_models,
+        server_middleware,
+        server_config,
+        server_utils,
+        _p(server_dir, "tests"),
+        _p(project_dir, "scripts"),
+        _p(project_dir, "docs"),
+    }
+    make_dirs(dirs, root=project_dir)
+    logger.info("Project directories created")
+
+    # The bootstrap commands form one dependent chain; running them as a
+    # single compound shell script avoids a fork/exec round-trip (and an
+    # os.chdir) per step.
+    bootstrap = " && ".join(
+        [
+            f"cd '{server_dir}'",
+            "npm init -y",
+            "npm install express pg cors dotenv firebase-admin morgan helmet",
+            f"cd '{project_dir}'",
+            "npx create-react-app client --template typescript",
+            f"cd '{client_dir}'",
+            "npm install axios react-router-dom",
+            "npm install -D tailwindcss postcss autoprefixer",
+            "npx tailwindcss init -p",
+            f"cd '{project_dir}'",
+            "python -m venv scripts/venv",
+            "scripts/venv/bin/pip install pyyaml boto3 firebase-admin requests",
+            "git init",
+        ]
+    )
+    # The script body is POSIX-only (quoting, venv bin paths), so it runs
+    # under bash unconditionally.
+    run_command(
+        ["bash", "-lc", "set -e; " + bootstrap],
+        "Client and server dependencies installed",
+        "Project bootstrap failed",
+    )
+
+    make_dirs(
+        {
+            client_components,
+            client_pages,
+            client_services,
+            client_hooks,
+            client_utils,
+            client_styles,
+            client_context,
+            client_config,
+        },
+        root=client_dir,
+    )
+
+    create_file(
+        _p(client_pages, "Home.tsx"),
+        "const Home = () => <div>Home</div>;\nexport default Home;\n",
+    )
+    create_file(
+        _p(client_pages, "About.tsx"),
+        "const About = () => <div>About</div>;\nexport default About;\n",
+    )
+    create_file(
+        _p(client_pages, "Dashboard.tsx"),
+        "const Dashboard = () => <div>Dashboard</div>;\nexport default Dashboard;\n",
+    )
+    create_file(
+        _p(client_pages, "Login.tsx"),
+        "const Login = () => <div>Login</div>;\nexport default Login;\n",
+    )
+    create_file(
+        _p(client_pages, "Register.tsx"),
+        "const Register = () => <div>Register</div>;\nexport default Register;\n",
+    )
+    create_file(
+        _p(client_pages, "NotFound.tsx"),
+        "const NotFound = () => <div>404</div>;\nexport default NotFound;\n",
+    )
+    create_file(
+        _p(client_components, "Navbar.tsx"),
+        "const Navbar = () => <nav>Navbar</nav>;\nexport default Navbar;\n",
+    )
+    create_file(
+        _p(client_components, "Footer.tsx"),
+        "const Footer = () => <footer>Footer</footer>;\nexport default Footer;\n",
+    )
+    create_file(
+        _p(client_components, "Layout.tsx"),
+        "const Layout = () => <div>Layout</div>;\nexport default Layout;\n",
+    )
+    create_file(
+        _p(client_components, "Button.tsx"),
+        "const Button = () => <button>Button</button>;\nexport default Button;\n",
+    )
+    create_file(
+        _p(client_components, "Card.tsx"),
+        "const Card = () => <div>Card</div>;\nexport default Card;\n",
+    )
+    create_file(
+        _p(client_components, "Spinner.tsx"),
+        "const Spinner = () => <div>Loading...</div>;\nexport default Spinner;\n",
+    )
+    create_file(
+        _p(client_services, "api.ts"),
+        "import axios from 'axios';\nexport const api = axios.create({ baseURL: '/api' });\n",
+    )
+    create_file(
+        _p(client_services, "auth.ts"),
+        "export const login = async () => {};\nexport const logout = async () => {};\n",
+    )
+    create_file(
+        _p(client_hooks, "useAuth.ts"),
+        "export const useAuth = () => ({ user: null });\n",
+    )
+    create_file(
+        _p(client_hooks, "useFetch.ts"),
+        "export const useFetch = (url: string) => ({ data: null });\n",
+    )
+    create_file(
+        _p(client_utils, "helpers.ts"),
+        "export const noop = () => {};\n",
+    )
+    create_file(
+        _p(client_utils, "constants.ts"),
+        "export const API_URL = '/api';\n",
+    )
+    create_file(
+        _p(client_context, "AuthContext.tsx"),
+        "import { createContext } from 'react';\nexport const AuthContext = createContext(null);\n",
+    )
+    create_file(
+        _p(client_styles, "globals.css"),
+        "@tailwind base;\n@tailwind components;\n@tailwind utilities;\n",
+    )
+    create_file(
+        _p(server_src, "index.js"),
+        "const app = require('./app');\napp.listen(5000);\n",
+    )
+    create_file(
+        _p(server_src, "app.js"),
+        "const express = require('express');\nconst app = express();\nmodule.exports = app;\n",
+    )
+    create_file(
+        _p(server_routes, "index.js"),
+        "const router = require('express').Router();\nmodule.exports = router;\n",
+    )
+    create_file(
+        _p(server_routes, "users.js"),
+        "const router = require('express').Router();\nmodule.exports = router;\n",
+    )
+    create_file(
+        _p(server_routes, "auth.js"),
+        "const router = require('express').Router();\nmodule.exports = router;\n",
+    )
+    create_file(
+        _p(server_controllers, "userController.js"),
+        "exports.getUsers = (req, res) => res.json([]);\n",
+    )
+    create_file(
+        _p(server_controllers, "authController.js"),
+        "exports.login = (req, res) => res.json({});\n",
+    )
+    create_file(
+        _p(server_models, "user.js"),
+        "module.exports = {};\n",
+    )
+    create_file(
+        _p(server_middleware, "auth.js"),
+        "module.exports = (req, res, next) => next();\n",
+    )
+    create_file(
+        _p(server_middleware, "errorHandler.js"),
+        "module.exports = (err, req, res, next) => res.status(500).json({});\n",
+    )
+    create_file(
+        _p(server_src, "config", "db.js"),
+        "const { Pool } = require('pg');\nmodule.exports = new Pool();\n",
+    )
+    create_file(
+        _p(server_utils, "logger.js"),
+        "module.exports = console;\n",
+    )
+    create_file(
+        _p(project_dir, "docker-compose.yml"),
+        "version: '3.8'\n\nservices:\n",
+    )
+    create_file(
+        _p(project_dir, "README.md"),
+        "# WebFrame App\n\nScaffolded by WebFrame.\n",
+    )
+    create_file(
+        _p(project_dir, ".gitignore"),
+        "node_modules/\n.env\nvenv/\n",
+    )
+    flush_files()
+    logger.info("Placeholder files created")
+
+    config_path = _p(project_dir, "config.yaml")
+    if os.path.exists(config_path):
+        setup = ProjectSetup(config_path)
+        setup.setup_project()
+
+    logger.info("Done! cd webframe-app to get started.")